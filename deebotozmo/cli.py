@@ -538,6 +538,8 @@ class CliUtil:
 
     async def after(self) -> None:
         """Close all connections."""
+        if self._bot is not None:
+            self._bot.close()
         await self._session.close()
 
     def _get_matched_device(self, device_match: Optional[str]) -> Vacuum:
@@ -2,6 +2,7 @@
 import logging
 from abc import ABC, abstractmethod
 from enum import IntEnum, unique
+from functools import lru_cache
 from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, Union
 
 from deebotozmo.event_emitter import VacuumEmitter
@@ -166,10 +167,10 @@ class SetCommand(_ExecuteCommand, ABC):
 class DisplayNameIntEnum(IntEnum):
     """Int enum with a property "display_name"."""
 
-    def __new__(cls, *args: Tuple, **_: Mapping) -> "DisplayNameIntEnum":
+    def __new__(cls, value: int, *_: Tuple, **__: Mapping) -> "DisplayNameIntEnum":
         """Create new enum."""
-        obj = int.__new__(cls)
-        obj._value_ = args[0]
+        obj = int.__new__(cls, value)
+        obj._value_ = value
         return obj
 
     def __init__(self, _: int, display_name: Optional[str] = None):
@@ -188,11 +189,19 @@ class DisplayNameIntEnum(IntEnum):
     def get(cls, value: str) -> "DisplayNameIntEnum":
         """Get enum member from name or display_name."""
         value = str(value).upper()
-        if value in cls.__members__:
-            return cls[value]
-
-        for member in cls:
-            if value == member.display_name.upper():
-                return member
+        member = _get_display_name_lookup(cls).get(value)
+        if member is not None:
+            return member
 
         raise ValueError(f"'{value}' is not a valid {cls.__name__} member")
+
+
+@lru_cache(maxsize=None)
+def _get_display_name_lookup(
+    enum: Type[DisplayNameIntEnum],
+) -> Dict[str, DisplayNameIntEnum]:
+    """Return a mapping of the upper case names and display names to the members."""
+    lookup = {member.display_name.upper(): member for member in enum}
+    # names have a higher priority than display names
+    lookup.update(enum.__members__)
+    return lookup
@@ -8,6 +8,12 @@ from .base import _CODE, VacuumEmitter, _NoArgsCommand
 
 _LOGGER = logging.getLogger(__name__)
 
+_FAIL_STATES: Dict[str, VacuumState] = {
+    "30007": VacuumState.DOCKED,  # Already charging
+    "5": VacuumState.ERROR,  # Busy with another command
+    "3": VacuumState.ERROR,  # Bot in stuck state, example dust bin out
+}
+
 
 class GetChargeState(_NoArgsCommand):
     """Get charge state command."""
@@ -33,15 +39,10 @@ class GetChargeState(_NoArgsCommand):
 
         status: Optional[VacuumState] = None
         if body.get("msg", None) == "fail":
-            if body["code"] == "30007":  # Already charging
-                status = VacuumState.DOCKED
-            elif body["code"] == "5":  # Busy with another command
-                status = VacuumState.ERROR
-            elif body["code"] == "3":  # Bot in stuck state, example dust bin out
-                status = VacuumState.ERROR
+            status = _FAIL_STATES.get(body[_CODE])
 
         if status:
-            events.status.notify(StatusEvent(True, VacuumState.DOCKED))
+            events.status.notify(StatusEvent(True, status))
             return True
 
         return False
@@ -10,6 +10,12 @@ from .base import _ExecuteCommand, _NoArgsCommand
 
 _LOGGER = logging.getLogger(__name__)
 
+_MOTION_STATES: Dict[Optional[str], VacuumState] = {
+    "working": VacuumState.CLEANING,
+    "pause": VacuumState.PAUSED,
+    "goCharging": VacuumState.RETURNING,
+}
+
 
 @unique
 class CleanAction(str, Enum):
@@ -70,31 +76,30 @@ class GetCleanInfo(_NoArgsCommand):
         """
 
         status: Optional[VacuumState] = None
+        state = data.get("state")
         if data.get("trigger") == "alert":
             status = VacuumState.ERROR
-        elif data.get("state") == "clean":
-            clean_state = data.get("cleanState", {})
-            motion_state = clean_state.get("motionState")
-            if motion_state == "working":
-                status = VacuumState.CLEANING
-            elif motion_state == "pause":
-                status = VacuumState.PAUSED
-            elif motion_state == "goCharging":
-                status = VacuumState.RETURNING
-
-            clean_type = clean_state.get("type")
-            content = clean_state.get("content", {})
-            if "type" in content:
-                clean_type = content.get("type")
-
-            if clean_type == "customArea":
-                area_values = content
-                if "value" in content:
-                    area_values = content.get("value")
-
-                _LOGGER.debug("Last custom area values (x1,y1,x2,y2): %s", area_values)
-
-        elif data.get("state") == "goCharging":
+        elif state == "clean":
+            clean_state = data.get("cleanState") or {}
+            status = _MOTION_STATES.get(clean_state.get("motionState"))
+
+            # the clean type is only used for debugging
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                clean_type = clean_state.get("type")
+                content = clean_state.get("content", {})
+                if "type" in content:
+                    clean_type = content.get("type")
+
+                if clean_type == "customArea":
+                    area_values = content
+                    if "value" in content:
+                        area_values = content.get("value")
+
+                    _LOGGER.debug(
+                        "Last custom area values (x1,y1,x2,y2): %s", area_values
+                    )
+
+        elif state == "goCharging":
             status = VacuumState.RETURNING
 
         if status:
@@ -25,19 +25,18 @@ class GetCleanLogs(CommandWithHandling):
             resp_logs: Optional[List[dict]] = response.get("logs")
 
             # Ecovacs API is changing their API, this request may not working properly
-            if resp_logs is not None and len(resp_logs) >= 0:
-                logs: List[CleanLogEntry] = []
-                for log in resp_logs:
-                    logs.append(
-                        CleanLogEntry(
-                            timestamp=log.get("ts"),
-                            image_url=log.get("imageUrl"),
-                            type=log.get("type"),
-                            area=log.get("area"),
-                            stop_reason=log.get("stopReason"),
-                            total_time=log.get("last"),
-                        )
+            if resp_logs is not None:
+                logs = [
+                    CleanLogEntry(
+                        timestamp=log.get("ts"),
+                        image_url=log.get("imageUrl"),
+                        type=log.get("type"),
+                        area=log.get("area"),
+                        stop_reason=log.get("stopReason"),
+                        total_time=log.get("last"),
                     )
+                    for log in resp_logs
+                ]
 
                 events.clean_logs.notify(CleanLogEvent(logs))
                 return True
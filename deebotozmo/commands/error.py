@@ -22,7 +22,7 @@ class GetError(_NoArgsCommand):
 
         :return: True if data was valid and no error was included
         """
-        codes = data.get("code", [])
+        codes = data.get("code")
         if codes:
             # the last error code
             error = codes[-1]
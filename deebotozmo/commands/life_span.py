@@ -49,7 +49,7 @@ class GetLifeSpan(CommandWithHandling):
             total = int(component.get("total", 0))
 
             if component_type and total > 0:
-                percent = round((left / total) * 100, 2)
+                percent = round(left * 100 / total, 2)
                 components[component_type.value] = percent  # type: ignore
             else:
                 _LOGGER.warning("Could not parse life span event with %s", data)
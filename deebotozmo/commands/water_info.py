@@ -31,12 +31,11 @@ class GetWaterInfo(_NoArgsCommand):
         :return: True if data was valid and no error was included
         """
         amount = data.get("amount", None)
-        mop_attached = bool(data.get("enable"))
-
         if amount is not None:
             try:
+                level = WaterLevel(int(amount)).display_name
                 events.water_info.notify(
-                    WaterInfoEvent(mop_attached, WaterLevel(int(amount)).display_name)
+                    WaterInfoEvent(bool(data.get("enable")), level)
                 )
                 return True
             except ValueError:
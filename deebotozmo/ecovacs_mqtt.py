@@ -2,7 +2,8 @@
 import json
 import logging
 import ssl
-from typing import Dict, List, MutableMapping, Optional
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, MutableMapping, Optional, Tuple
 
 from cachetools import TTLCache
 from gmqtt import Client, Subscription
@@ -15,19 +16,24 @@ from deebotozmo.vacuum_bot import VacuumBot
 _LOGGER = logging.getLogger(__name__)
 
 
-def _get_subscriptions(vacuum: Vacuum) -> List[Subscription]:
-    return [
+@lru_cache(maxsize=256)
+def _get_topics(did: str, get_class: str, resource: str) -> Tuple[str, ...]:
+    return (
         # iot/atr/[command]]/[did]]/[class]]/[resource]/j
-        Subscription(f"iot/atr/+/{vacuum.did}/{vacuum.get_class}/{vacuum.resource}/j"),
+        f"iot/atr/+/{did}/{get_class}/{resource}/j",
         # iot/p2p/[command]]/[sender did]/[sender class]]/[sender resource]
         # /[receiver did]/[receiver class]]/[receiver resource]/[q|p/[request id/j
         # [q|p] q-> request p-> response
-        Subscription(
-            f"iot/p2p/+/+/+/+/{vacuum.did}/{vacuum.get_class}/{vacuum.resource}/q/+/j"
-        ),
-        Subscription(
-            f"iot/p2p/+/{vacuum.did}/{vacuum.get_class}/{vacuum.resource}/+/+/+/p/+/j"
-        ),
+        f"iot/p2p/+/+/+/+/{did}/{get_class}/{resource}/q/+/j",
+        f"iot/p2p/+/{did}/{get_class}/{resource}/+/+/+/p/+/j",
+    )
+
+
+def _get_subscriptions(vacuum: Vacuum) -> List[Subscription]:
+    # Subscription objects are mutated by the client, therefore only the topics are cached
+    return [
+        Subscription(topic)
+        for topic in _get_topics(vacuum.did, vacuum.get_class, vacuum.resource)
     ]
 
 
@@ -47,19 +53,32 @@ class EcovacsMqtt:
 
         self._client: Optional[Client] = None
         self._received_set_commands: MutableMapping[str, SetCommand] = TTLCache(
-            maxsize=60 * 60, ttl=60
+            maxsize=128, ttl=60
         )
+        self._topic_handlers: Dict[
+            str, Callable[[List[str], bytes], Awaitable[None]]
+        ] = {
+            "atr": self._handle_atr,
+            "p2p": self._handle_p2p,
+        }
 
         # pylint: disable=unused-argument
         async def _on_message(
             client: Client, topic: str, payload: bytes, qos: int, properties: Dict
         ) -> None:
-            _LOGGER.debug("Got message: topic=%s; payload=%s;", topic, payload.decode())
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Got message: topic=%s; payload=%s;", topic, payload.decode()
+                )
+
             topic_split = topic.split("/")
-            if topic.startswith("iot/atr"):
-                await self._handle_atr(topic_split, payload)
-            elif topic.startswith("iot/p2p"):
-                self._handle_p2p(topic_split, payload)
+            handler = (
+                self._topic_handlers.get(topic_split[1])
+                if len(topic_split) > 1
+                else None
+            )
+            if handler:
+                await handler(topic_split, payload)
             else:
                 _LOGGER.debug("Got unsupported topic: %s", topic)
 
@@ -96,8 +115,8 @@ class EcovacsMqtt:
         vacuum = vacuum_bot.vacuum
 
         if self._subscribers.pop(vacuum.did, None) and self._client:
-            for subscription in _get_subscriptions(vacuum):
-                self._client.unsubscribe(subscription.topic)
+            for topic in _get_topics(vacuum.did, vacuum.get_class, vacuum.resource):
+                self._client.unsubscribe(topic)
 
     def disconnect(self) -> None:
         """Disconnect from MQTT."""
@@ -106,28 +125,28 @@ class EcovacsMqtt:
         self._subscribers.clear()
 
     async def _handle_atr(self, topic_split: List[str], payload: bytes) -> None:
+        bot = self._subscribers.get(topic_split[3])
+        if bot:
+            try:
+                await bot.handle(topic_split[2], json.loads(payload))
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.error(
+                    "An exception occurred during handling atr message", exc_info=True
+                )
+
+    async def _handle_p2p(self, topic_split: List[str], payload: bytes) -> None:
         try:
-            bot = self._subscribers.get(topic_split[3])
-            if bot:
-                data = json.loads(payload)
-                await bot.handle(topic_split[2], data)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.error(
-                "An exception occurred during handling atr message", exc_info=True
-            )
-
-    def _handle_p2p(self, topic_split: List[str], payload: bytes) -> None:
-        try:
-            command_name = topic_split[2]
+            # iot/p2p/[command]/[sender did]/[sender class]/[sender resource]
+            # /[receiver did]/[receiver class]/[receiver resource]/[q|p]/[request id]/j
+            command_name, sender_did = topic_split[2:4]
+            message_type, request_id = topic_split[9:11]
             if command_name not in SET_COMMAND_NAMES:
                 # command doesn't need special treatment or is not supported yet
                 return
 
-            is_request = topic_split[9] == "q"
-            request_id = topic_split[10]
+            payload_json = json.loads(payload)
 
-            if is_request:
-                payload_json = json.loads(payload)
+            if message_type == "q":
                 try:
                     data = payload_json["body"]["data"]
                 except KeyError:
@@ -151,10 +170,9 @@ class EcovacsMqtt:
                     )
                     return
 
-                bot = self._subscribers.get(topic_split[3])
+                bot = self._subscribers.get(sender_did)
                 if bot:
-                    data = json.loads(payload)
-                    if command.handle(bot.events, data) and isinstance(
+                    if command.handle(bot.events, payload_json) and isinstance(
                         command.args, dict
                     ):
                         command.get_command.handle(bot.events, command.args)
@@ -2,8 +2,17 @@
 import asyncio
 import logging
 from asyncio import Task
-from dataclasses import dataclass
-from typing import Awaitable, Callable, Final, Generic, List, Optional, TypeVar
+from dataclasses import dataclass, fields
+from typing import (
+    Awaitable,
+    Callable,
+    Final,
+    Generic,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from deebotozmo.events import (
     BatteryEvent,
@@ -24,20 +33,51 @@ _LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+_MAX_QUEUED_EVENTS: Final = 100
+
 
 class EventListener(Generic[T]):
-    """Object that allows event consumers to easily unsubscribe from events."""
+    """Object that allows event consumers to easily unsubscribe from events.
+
+    Events are queued and passed one after another to the callback. If the callback
+    cannot keep up, the oldest queued events are dropped. Events queued before
+    unsubscribing are still passed to the callback.
+    """
 
     def __init__(
         self, emitter: "EventEmitter", callback: Callable[[T], Awaitable[None]]
     ) -> None:
         self._emitter: Final = emitter
         self.callback: Final = callback
+        self._queue: "asyncio.Queue[T]" = asyncio.Queue(_MAX_QUEUED_EVENTS)
+        self._worker: Optional[Task] = None
 
     def unsubscribe(self) -> None:
         """Unsubscribe from event representation."""
         self._emitter.unsubscribe(self)
 
+    def notify(self, event: T) -> None:
+        """Queue given event for the callback."""
+        if self._queue.full():
+            # keep the newest event as the emitter skips further equal events
+            dropped = self._queue.get_nowait()
+            _LOGGER.warning("Subscriber is too slow. Dropping %s", dropped)
+        self._queue.put_nowait(event)
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._process_events())
+
+    async def _process_events(self) -> None:
+        # the worker stops, when all queued events are processed
+        while not self._queue.empty():
+            event = self._queue.get_nowait()
+            try:
+                await self.callback(event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.error(
+                    "An exception occurred during handling %s", event, exc_info=True
+                )
+
 
 class EventEmitter(Generic[T]):
     """A very simple event emitting system."""
@@ -47,11 +87,12 @@ class EventEmitter(Generic[T]):
         refresh_function: Optional[Callable[[], Awaitable[None]]] = None,
         notify_on_equal_event: bool = False,
     ):
-        self._subscribers: List[EventListener] = []
+        self._subscribers: Tuple[EventListener, ...] = ()
         self._refresh_function: Optional[
             Callable[[], Awaitable[None]]
         ] = refresh_function
         self._semaphore = asyncio.Semaphore(1)
+        self._requested_refresh_task: Optional[Task] = None
         self._last_event: Optional[T] = None
         self._notify_on_equal_event = notify_on_equal_event
 
@@ -63,11 +104,11 @@ class EventEmitter(Generic[T]):
     def subscribe(self, callback: Callable[[T], Awaitable[None]]) -> EventListener[T]:
         """Subscribe to event."""
         listener = EventListener(self, callback)
-        self._subscribers.append(listener)
+        self._subscribers = self._subscribers + (listener,)
 
         if self._last_event:
             # Notify subscriber directly with the last event
-            asyncio.create_task(listener.callback(self._last_event))
+            listener.notify(self._last_event)
         elif len(self._subscribers) == 1:
             # first subscriber therefore do refresh
             self.request_refresh()
@@ -76,7 +117,17 @@ class EventEmitter(Generic[T]):
 
     def unsubscribe(self, listener: EventListener[T]) -> None:
         """Unsubscribe from event."""
-        self._subscribers.remove(listener)
+        self._subscribers = tuple(
+            subscriber for subscriber in self._subscribers if subscriber is not listener
+        )
+
+    def close(self) -> None:
+        """Unsubscribe all listeners and cancel a pending refresh."""
+        self._subscribers = ()
+
+        if self._requested_refresh_task is not None:
+            self._requested_refresh_task.cancel()
+            self._requested_refresh_task = None
 
     def notify(self, event: T) -> bool:
         """Notify subscriber with given event representation."""
@@ -88,7 +139,7 @@ class EventEmitter(Generic[T]):
         if self._subscribers:
             _LOGGER.debug("Notify subscribers with %s", event)
             for subscriber in self._subscribers:
-                asyncio.create_task(subscriber.callback(event))
+                subscriber.notify(event)
             return True
 
         _LOGGER.debug("No subscribers... Discharging %s", event)
@@ -105,8 +156,13 @@ class EventEmitter(Generic[T]):
 
     def request_refresh(self) -> None:
         """Request manual refresh."""
-        if len(self._subscribers) > 0:
-            asyncio.create_task(self._call_refresh_function())
+        if len(self._subscribers) > 0 and (
+            self._requested_refresh_task is None or self._requested_refresh_task.done()
+        ):
+            # only one requested refresh at a time, as the result would be the same
+            self._requested_refresh_task = asyncio.create_task(
+                self._call_refresh_function()
+            )
 
 
 class PollingEventEmitter(EventEmitter[T]):
@@ -126,7 +182,7 @@ class PollingEventEmitter(EventEmitter[T]):
 
         async def on_status(event: StatusEvent) -> None:
             self._status = event.state
-            if event.state == VacuumState.CLEANING:
+            if event.state is VacuumState.CLEANING:
                 self._start_refresh_task()
             else:
                 self._stop_refresh_task()
@@ -151,7 +207,7 @@ class PollingEventEmitter(EventEmitter[T]):
     def subscribe(self, callback: Callable[[T], Awaitable[None]]) -> EventListener[T]:
         """Subscribe to event."""
         listener = super().subscribe(callback)
-        if self._status == VacuumState.CLEANING:
+        if self._status is VacuumState.CLEANING:
             self._start_refresh_task()
         return listener
 
@@ -162,19 +218,42 @@ class PollingEventEmitter(EventEmitter[T]):
         if len(self._subscribers) == 0:
             self._stop_refresh_task()
 
+    def close(self) -> None:
+        """Unsubscribe all listeners and stop refreshing."""
+        super().close()
+        self._stop_refresh_task()
+
 
-@dataclass
+@dataclass(frozen=True)
 class MapEmitter:
     """Class to combine all different map event emitters."""
 
+    __slots__ = ("map", "rooms")
+
     map: EventEmitter[MapEvent]
     rooms: EventEmitter[RoomsEvent]
 
+    def __iter__(self) -> Iterator[EventEmitter]:
+        """Iterate over all event emitters."""
+        return (getattr(self, field.name) for field in fields(self))
 
-@dataclass
+
+@dataclass(frozen=True)
 class VacuumEmitter(MapEmitter):
     """Class to combine all different vacuum event emitters."""
 
+    __slots__ = (
+        "battery",
+        "clean_logs",
+        "error",
+        "fan_speed",
+        "lifespan",
+        "stats",
+        "status",
+        "water_info",
+        "custom_command",
+    )
+
     battery: EventEmitter[BatteryEvent]
     clean_logs: EventEmitter[CleanLogEvent]
     error: EventEmitter[ErrorEvent]
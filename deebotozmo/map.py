@@ -7,7 +7,7 @@ import struct
 from io import BytesIO
 from typing import Any, Awaitable, Callable, Dict, Final, List, Optional, Union
 
-from numpy import ndarray, reshape, zeros
+from numpy import array, flatnonzero, full, int64, ndarray, reshape, zeros
 from PIL import Image, ImageDraw, ImageOps
 
 from deebotozmo.commands import (
@@ -48,20 +48,17 @@ _ROOM_INT_TO_NAME = {
 
 def _decompress_7z_base64_data(data: str) -> bytes:
     _LOGGER.debug("[decompress7zBase64Data] Begin")
-    final_array = bytearray()
-
     # Decode Base64
-    decoded = base64.b64decode(data)
-
-    i = 0
-    for idx in decoded:
-        if i == 8:
-            final_array += b"\x00\x00\x00\x00"
-        final_array.append(idx)
-        i += 1
+    decoded = memoryview(base64.b64decode(data))
 
+    # The header is missing 4 bytes of the uncompressed size field, which are fed
+    # separately to the decompressor, so the payload does not need to be copied
     dec = lzma.LZMADecompressor(lzma.FORMAT_AUTO, None, None)
-    decompressed_data = dec.decompress(final_array)
+    decompressed_data = (
+        dec.decompress(decoded[:8])
+        + dec.decompress(b"\x00\x00\x00\x00")
+        + dec.decompress(decoded[8:])
+    )
 
     _LOGGER.debug("[decompress7zBase64Data] Done")
     return decompressed_data
@@ -117,6 +114,7 @@ class Map:
         self._amount_rooms: int = 0
         self._trace_values: List[int] = []
         self._map_pieces: List[MapPiece] = [MapPiece(i) for i in range(64)]
+        self._map_piece_crcs: ndarray = full(64, MapPiece.NOT_INUSE, dtype=int64)
         self._is_map_up_to_date: bool = False
         self._base64_image: Optional[bytes] = None
         self._last_requested_width: Optional[int] = None
@@ -151,7 +149,7 @@ class Map:
 
             message = message.get("resp", message)
 
-        body = message.get("body", {})
+        body = message.get("body", None)
 
         if not body:
             _LOGGER.warning("Invalid Event %s: %s", command_name, message)
@@ -206,24 +204,20 @@ class Map:
         self._rooms = []
         self._amount_rooms = len(subsets) if subsets else 0
 
-        if requested:
-            tasks = []
-            for subset in subsets:
-                tasks.append(
-                    asyncio.create_task(
-                        self._execute_command(
-                            GetMapSubSet(
-                                map_id=map_id,
-                                map_set_id=map_set_id,
-                                map_type=map_type,
-                                map_subset_id=subset["mssid"],
-                            )
+        if requested and subsets:
+            await asyncio.gather(
+                *(
+                    self._execute_command(
+                        GetMapSubSet(
+                            map_id=map_id,
+                            map_set_id=map_set_id,
+                            map_type=map_type,
+                            map_subset_id=subset["mssid"],
                         )
                     )
+                    for subset in subsets
                 )
-
-            if tasks:
-                await asyncio.gather(*tasks)
+            )
 
     def _handle_map_sub_set(self, event_data: dict) -> None:
         if event_data.get("type", None) != "ar":
@@ -266,25 +260,26 @@ class Map:
 
     async def _handle_major_map(self, event_data: dict, requested: bool) -> None:
         _LOGGER.debug("[_handle_major_map] begin")
-        values = event_data["value"].split(",")
 
         if requested:
-            tasks = []
-            for i in range(64):
-                if self._map_pieces[i].is_update(values[i]):
-                    _LOGGER.debug(
-                        "[_handle_major_map] MapPiece %d needs to be updated", i
-                    )
+            values = array(event_data["value"].split(","), dtype=int64)
+            changed = flatnonzero(values != self._map_piece_crcs)
+            self._map_piece_crcs[changed] = values[changed]
+            _LOGGER.debug("[_handle_major_map] Changed MapPieces: %s", changed)
+
+            requests: List[Awaitable[None]] = []
+            for i in changed:
+                in_use = bool(values[i] != MapPiece.NOT_INUSE)
+                self._map_pieces[i].in_use = in_use
+                if in_use:
                     self._is_map_up_to_date = False
-                    tasks.append(
-                        asyncio.create_task(
-                            self._execute_command(
-                                GetMinorMap(map_id=event_data["mid"], piece_index=i)
-                            )
+                    requests.append(
+                        self._execute_command(
+                            GetMinorMap(map_id=event_data["mid"], piece_index=int(i))
                         )
                     )
-            if tasks:
-                await asyncio.gather(*tasks)
+            if requests:
+                await asyncio.gather(*requests)
 
     def _handle_minor_map(self, event_data: dict) -> None:
         self._add_map_piece(event_data["pieceIndex"], event_data["pieceValue"])
@@ -469,34 +464,22 @@ class Map:
 class MapPiece:
     """Map piece representation."""
 
-    NOT_INUSE: str = "1295764014"
+    NOT_INUSE: int = 1295764014
 
     def __init__(self, index: int) -> None:
         self._index = index
         self._points: Optional[ndarray] = None
         self._in_use: bool = False
-        self._piece: str = MapPiece.NOT_INUSE
-
-    def is_update(self, map_piece: str) -> bool:
-        """Return True if update is required."""
-        piece = map_piece
-        if self._piece != piece:
-            self._piece = piece
-
-            if piece == MapPiece.NOT_INUSE:
-                self._in_use = False
-                return False
-            self._in_use = True
-            return True
-
-        _LOGGER.debug("No update needed for piece idx %d", self._index)
-        return False
 
     @property
     def in_use(self) -> bool:
         """Return True if piece is in use."""
         return self._in_use
 
+    @in_use.setter
+    def in_use(self, in_use: bool) -> None:
+        self._in_use = in_use
+
     @property
     def points(self) -> ndarray:
         """I'm the 'x' property."""
@@ -7,6 +7,8 @@ from typing import Optional
 class Vacuum(dict):
     """Class holds all values, which we get from api. Common values can be accessed through properties."""
 
+    __slots__ = ()
+
     @property
     def company(self) -> str:
         """Return company."""
@@ -69,6 +71,8 @@ class Room:
 class RequestAuth:
     """Request authentication representation."""
 
+    __slots__ = ("user_id", "realm", "token", "resource")
+
     user_id: str
     realm: str
     token: str
@@ -1,12 +1,17 @@
 """Util module."""
 import asyncio
-import copy
 import hashlib
 import os
-from typing import Awaitable, Callable, List, Union
+from functools import partial
+from types import TracebackType
+from typing import Awaitable, Callable, List, Optional, Type, Union
 
 from deebotozmo.commands import Command
 
+_SANITIZE_LOG_KEYS = frozenset(
+    {"auth", "token", "userId", "userid", "accessToken", "uid", "toId"}
+)
+
 
 def str_to_bool_or_cert(string: Union[bool, str]) -> Union[bool, str]:
     """Convert string to bool or certificate."""
@@ -17,10 +22,10 @@ def str_to_bool_or_cert(string: Union[bool, str]) -> Union[bool, str]:
         return False
 
     if string is not None:
+        # User could provide a path to a CA Cert as well, which is useful for Bumper
+        if os.path.isfile(str(string)):
+            return string
         if os.path.exists(str(string)):
-            # User could provide a path to a CA Cert as well, which is useful for Bumper
-            if os.path.isfile(str(string)):
-                return string
             raise ValueError(f"Certificate path provided is not a file: {string}")
 
     raise ValueError(f'Cannot convert "{string}" to a bool or certificate path')
@@ -28,7 +33,7 @@ def str_to_bool_or_cert(string: Union[bool, str]) -> Union[bool, str]:
 
 def md5(text: str) -> str:
     """Hash text using md5."""
-    return hashlib.md5(bytes(str(text), "utf8")).hexdigest()
+    return hashlib.md5(text.encode("utf8")).hexdigest()
 
 
 def get_refresh_function(
@@ -37,27 +42,69 @@ def get_refresh_function(
 ) -> Callable[[], Awaitable[None]]:
     """Return refresh function for given commands."""
     if len(commands) == 1:
+        return partial(execute_command, commands[0])
 
-        async def refresh() -> None:
-            await execute_command(commands[0])
-
-    else:
-
-        async def refresh() -> None:
-            tasks = []
-            for command in commands:
-                tasks.append(asyncio.create_task(execute_command(command)))
-
-            await asyncio.gather(*tasks)
+    async def refresh() -> None:
+        await asyncio.gather(*(execute_command(command) for command in commands))
 
     return refresh
 
 
 def sanitize_data(data: dict) -> dict:
     """Sanitize data (remove personal data)."""
-    sanitized_data = copy.deepcopy(data)
-    for key in ["auth", "token", "userId", "userid", "accessToken", "uid", "toId"]:
-        if key in sanitized_data:
-            sanitized_data[key] = "[REMOVED]"
-
-    return sanitized_data
+    return {
+        key: "[REMOVED]" if key in _SANITIZE_LOG_KEYS else value
+        for key, value in data.items()
+    }
+
+
+def _verify_limit(limit: int) -> None:
+    if limit < 1:
+        raise ValueError(f"Limit must be at least 1, got {limit}")
+
+
+class ConcurrencyLimiter:
+    """Limit the number of concurrently running operations.
+
+    Works like asyncio.Semaphore, but the limit can be changed at runtime.
+    """
+
+    def __init__(self, limit: int) -> None:
+        _verify_limit(limit)
+        self._limit = limit
+        self._running = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Return the maximum number of concurrently running operations."""
+        return self._limit
+
+    async def set_limit(self, limit: int) -> None:
+        """Change the maximum number of concurrently running operations."""
+        _verify_limit(limit)
+        async with self._condition:
+            self._limit = limit
+            # waiters must recheck the limit as it could be increased
+            self._condition.notify_all()
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            try:
+                await self._condition.wait_for(lambda: self._running < self._limit)
+            except asyncio.CancelledError:
+                # we may have been woken up for a free slot, pass it to the next waiter
+                if self._running < self._limit:
+                    self._condition.notify()
+                raise
+            self._running += 1
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        async with self._condition:
+            self._running -= 1
+            self._condition.notify()
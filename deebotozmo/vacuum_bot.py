@@ -1,14 +1,13 @@
 """Vacuum bot module."""
-import asyncio
-import inspect
 import logging
-import re
-from typing import Any, Dict, Final, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, Final, FrozenSet, Optional, Tuple, Type, Union
 
 import aiohttp
 
 from deebotozmo.commands import (
     COMMANDS,
+    MAP_COMMANDS,
     Clean,
     Command,
     CommandWithHandling,
@@ -19,7 +18,6 @@ from deebotozmo.commands import (
     GetError,
     GetFanSpeed,
     GetLifeSpan,
-    GetPos,
     GetStats,
     GetWaterInfo,
 )
@@ -41,12 +39,55 @@ from deebotozmo.events import (
 )
 from deebotozmo.map import Map
 from deebotozmo.models import RequestAuth, Vacuum, VacuumState
-from deebotozmo.util import get_refresh_function
+from deebotozmo.util import ConcurrencyLimiter, get_refresh_function
 
 _LOGGER = logging.getLogger(__name__)
 
-_COMMAND_REPLACE_PATTERN = "^((on)|(off)|(report))"
-_COMMAND_REPLACE_REPLACEMENT = "get"
+_COMMAND_REPLACE_PREFIXES: Final = ("on", "off", "report")
+_COMMAND_REPLACE_REPLACEMENT: Final = "get"
+_CLEAN_RESUME: Final = Clean(CleanAction.RESUME)
+_CLEAN_START: Final = Clean(CleanAction.START)
+
+
+@lru_cache(maxsize=256)
+def _normalize_command_name(command_name: str) -> str:
+    """Return the command name without any prefix or suffix variations."""
+    # Handle command start start with "on","off","report" the same as "get" commands
+    if command_name.startswith(_COMMAND_REPLACE_PREFIXES):
+        for prefix in _COMMAND_REPLACE_PREFIXES:
+            if command_name.startswith(prefix):
+                command_name = (
+                    _COMMAND_REPLACE_REPLACEMENT + command_name[len(prefix) :]
+                )
+                break
+
+    # T8 series and newer
+    if command_name.endswith("_V2"):
+        command_name = command_name[:-3]
+
+    return command_name
+
+
+def _build_command_aliases() -> Dict[str, Type[CommandWithHandling]]:
+    """Return all names, under which a bot can send the response of a command."""
+    aliases: Dict[str, Type[CommandWithHandling]] = {}
+    for name, command in COMMANDS.items():
+        names = [name]
+        if name.startswith(_COMMAND_REPLACE_REPLACEMENT):
+            suffix = name[len(_COMMAND_REPLACE_REPLACEMENT) :]
+            names.extend(prefix + suffix for prefix in _COMMAND_REPLACE_PREFIXES)
+
+        for alias in names + [f"{alias}_V2" for alias in names]:
+            if _normalize_command_name(alias) == name:
+                aliases[alias] = command
+
+    return aliases
+
+
+_COMMAND_ALIASES: Final = _build_command_aliases()
+_MAP_COMMAND_NAMES: Final[FrozenSet[str]] = frozenset(
+    command.name for command in MAP_COMMANDS  # type: ignore
+)
 
 
 class VacuumBot:
@@ -61,16 +102,17 @@ class VacuumBot:
         continent: str,
         country: str,
         verify_ssl: Union[bool, str] = True,
+        max_concurrent_requests: int = 3,
     ):
-        self._semaphore = asyncio.Semaphore(3)
+        self._request_limiter = ConcurrencyLimiter(max_concurrent_requests)
         self._session = session
         self._status: StatusEvent = StatusEvent(vacuum.status == 1, None)
         self.vacuum: Final[Vacuum] = vacuum
 
-        portal_url = EcovacsAPI.PORTAL_URL_FORMAT.format(continent=continent)
-
         if country.lower() == "cn":
             portal_url = EcovacsAPI.PORTAL_URL_FORMAT_CN
+        else:
+            portal_url = EcovacsAPI.PORTAL_URL_FORMAT.format(continent=continent)
 
         self.json: EcovacsJSON = EcovacsJSON(session, auth, portal_url, verify_ssl)
 
@@ -112,19 +154,20 @@ class VacuumBot:
             custom_command=EventEmitter[CustomCommandEvent](),
         )
 
+        self._refreshable_emitters: Final[Tuple[EventEmitter, ...]] = tuple(
+            emitter for emitter in self.events if emitter is not status_
+        )
+
         async def on_status(event: StatusEvent) -> None:
             last_status = self._status
             self._status = event
             if (not last_status.available) and event.available:
                 # bot was unavailable
-                for name, obj in inspect.getmembers(
-                    self.events, lambda obj: isinstance(obj, EventEmitter)
-                ):
-                    if name != "status":
-                        obj.request_refresh()
+                for emitter in self._refreshable_emitters:
+                    emitter.request_refresh()
             elif (
-                last_status.state != VacuumState.DOCKED
-                and event.state == VacuumState.DOCKED
+                last_status.state is not VacuumState.DOCKED
+                and event.state is VacuumState.DOCKED
             ):
                 self.events.clean_logs.request_refresh()
 
@@ -132,21 +175,35 @@ class VacuumBot:
 
     async def execute_command(self, command: Union[Command, CustomCommand]) -> None:
         """Execute given command and handle response."""
-        if (
-            command == Clean(CleanAction.RESUME)
-            and self._status.state != VacuumState.PAUSED
-        ):
-            command = Clean(CleanAction.START)
-        elif (
-            command == Clean(CleanAction.START)
-            and self._status.state == VacuumState.PAUSED
-        ):
-            command = Clean(CleanAction.RESUME)
-
-        async with self._semaphore:
+        if isinstance(command, Clean):
+            if (
+                command.args == _CLEAN_RESUME.args
+                and self._status.state is not VacuumState.PAUSED
+            ):
+                command = _CLEAN_START
+            elif (
+                command.args == _CLEAN_START.args
+                and self._status.state is VacuumState.PAUSED
+            ):
+                command = _CLEAN_RESUME
+
+        async with self._request_limiter:
             response = await self.json.send_command(command, self.vacuum)
 
-        await self.handle(command, response)
+        if isinstance(command, (CommandWithHandling, CustomCommand)):
+            # handling the response is synchronous, no need for another coroutine
+            self._handle_command(command, response)
+        else:
+            await self._handle_named(command.name, response, True)
+
+    async def set_max_concurrent_requests(self, max_concurrent_requests: int) -> None:
+        """Change the maximum number of concurrently executed commands."""
+        await self._request_limiter.set_limit(max_concurrent_requests)
+
+    def close(self) -> None:
+        """Close the bot by unsubscribing all listeners and stopping any polling."""
+        for emitter in self.events:
+            emitter.close()
 
     def set_available(self, available: bool) -> None:
         """Set available."""
@@ -167,44 +224,48 @@ class VacuumBot:
         :param message: the message (data) of it
         :return: None
         """
+        if isinstance(command, str):
+            await self._handle_named(command, message, False)
+        elif isinstance(command, (CommandWithHandling, CustomCommand)):
+            self._handle_command(command, message)
+        else:
+            await self._handle_named(command.name, message, True)
 
-        if isinstance(command, (CommandWithHandling, CustomCommand)):
+    def _handle_command(
+        self,
+        command: Union[CommandWithHandling, CustomCommand],
+        message: Dict[str, Any],
+    ) -> None:
+        """Handle the response of a command, which handles it by itself."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Handle %s: %s", command.name, message)
-            command.handle_requested(self.events, message)
-        else:
-            if isinstance(command, str):
-                command_name = command
-            else:
-                command_name = command.name
 
+        command.handle_requested(self.events, message)
+
+    async def _handle_named(
+        self, command_name: str, message: Dict[str, Any], requested: bool
+    ) -> None:
+        """Handle the given message by the command name.
+
+        :param command_name: the name of the command or event
+        :param message: the message (data) of it
+        :param requested: True if the message is the response of a manual request
+        """
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Handle %s: %s", command_name, message)
-            fw_version = message.get("header", {}).get("fwVer", None)
-            if fw_version:
-                self.fw_version = fw_version
-
-            # Handle command start start with "on","off","report" the same as "get" commands
-            command_name = re.sub(
-                _COMMAND_REPLACE_PATTERN,
-                _COMMAND_REPLACE_REPLACEMENT,
-                command_name,
-            )
 
-            # T8 series and newer
-            if command_name.endswith("_V2"):
-                command_name = command_name[:-3]
-
-            found_command = COMMANDS.get(command_name, None)
-            if found_command:
-                found_command.handle(self.events, message)
-            else:
-                if command_name in COMMANDS.keys():
-                    raise RuntimeError(
-                        "Command support new format. Should never happen! Please contact developers."
-                    )
-
-                if "Map" in command_name or command_name == GetPos.name:
-                    await self.map.handle(
-                        command_name, message, not isinstance(command, str)
-                    )
-                else:
-                    _LOGGER.debug('Unknown command "%s" with %s', command_name, message)
+        header = message.get("header", None)
+        fw_version = header.get("fwVer", None) if header else None
+        if fw_version and fw_version != self.fw_version:
+            self.fw_version = fw_version
+
+        found_command = _COMMAND_ALIASES.get(command_name, None)
+        if found_command:
+            found_command.handle(self.events, message)
+            return
+
+        command_name = _normalize_command_name(command_name)
+        if command_name in _MAP_COMMAND_NAMES:
+            await self.map.handle(command_name, message, requested)
+        else:
+            _LOGGER.debug('Unknown command "%s" with %s', command_name, message)
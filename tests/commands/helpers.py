@@ -1,21 +1,21 @@
-from typing import Set, Type
+from typing import Type
 
 from deebotozmo.commands.base import DisplayNameIntEnum
 
 
 def verify_DisplayNameEnum_unique(enum: Type[DisplayNameIntEnum]):
     assert issubclass(enum, DisplayNameIntEnum)
-    names: Set[str] = set()
-    values: Set[int] = set()
-    for member in enum:
-        assert member.value not in values
-        values.add(member.value)
+    members = list(enum)
+    assert all(int(member) == member.value for member in members)
 
-        name = member.name.lower()
-        assert name not in names
-        names.add(name)
+    values = {member.value for member in members}
+    assert len(values) == len(members)
 
-        display_name = member.display_name.lower()
-        if display_name != name:
-            assert display_name not in names
-            names.add(display_name)
\ No newline at end of file
+    names = [member.name.lower() for member in members]
+    display_names = [member.display_name.lower() for member in members]
+    all_names = names + [
+        display_name
+        for display_name, name in zip(display_names, names)
+        if display_name != name
+    ]
+    assert len(set(all_names)) == len(all_names)
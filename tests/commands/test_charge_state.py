@@ -0,0 +1,27 @@
+from unittest.mock import Mock
+
+import pytest
+
+from deebotozmo.commands import GetChargeState
+from deebotozmo.events import StatusEvent
+from deebotozmo.models import VacuumState
+
+
+@pytest.mark.parametrize(
+    "code, expected",
+    [
+        ("30007", VacuumState.DOCKED),
+        ("5", VacuumState.ERROR),
+        ("3", VacuumState.ERROR),
+    ],
+)
+def test_GetChargeState_fail(code: str, expected: VacuumState):
+    events = Mock()
+    assert GetChargeState.handle(events, {"body": {"code": code, "msg": "fail"}})
+    events.status.notify.assert_called_once_with(StatusEvent(True, expected))
+
+
+def test_GetChargeState_fail_unknown_code():
+    events = Mock()
+    assert not GetChargeState.handle(events, {"body": {"code": "1", "msg": "fail"}})
+    events.status.notify.assert_not_called()
@@ -4,4 +4,10 @@ from .helpers import verify_DisplayNameEnum_unique
 
 
 def test_FanSpeedLevel_unique():
-    verify_DisplayNameEnum_unique(FanSpeedLevel)
\ No newline at end of file
+    verify_DisplayNameEnum_unique(FanSpeedLevel)
+
+
+def test_FanSpeedLevel_get():
+    assert FanSpeedLevel.get("max+") is FanSpeedLevel.MAX_PLUS
+    assert FanSpeedLevel.get("MAX_PLUS") is FanSpeedLevel.MAX_PLUS
+    assert FanSpeedLevel.get("quiet") is FanSpeedLevel.QUIET
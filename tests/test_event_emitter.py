@@ -0,0 +1,125 @@
+import asyncio
+from typing import List
+
+from deebotozmo.event_emitter import _MAX_QUEUED_EVENTS, EventEmitter
+from deebotozmo.events import BatteryEvent
+
+
+def test_notify_in_order_until_unsubscribed():
+    async def run() -> List[int]:
+        received: List[int] = []
+
+        async def callback(event: BatteryEvent) -> None:
+            await asyncio.sleep(0)
+            received.append(event.value)
+
+        emitter = EventEmitter[BatteryEvent]()
+        listener = emitter.subscribe(callback)
+        for value in range(5):
+            emitter.notify(BatteryEvent(value))
+        await asyncio.sleep(0.01)
+
+        listener.unsubscribe()
+        emitter.notify(BatteryEvent(100))
+        await asyncio.sleep(0.01)
+        return received
+
+    assert asyncio.run(run()) == [0, 1, 2, 3, 4]
+
+
+def test_request_refresh_coalesced():
+    async def run() -> int:
+        calls = 0
+
+        async def refresh() -> None:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+
+        async def callback(_: BatteryEvent) -> None:
+            pass
+
+        emitter = EventEmitter[BatteryEvent](refresh)
+        emitter.subscribe(callback)
+        for _ in range(5):
+            emitter.request_refresh()
+        await asyncio.sleep(0.01)
+        return calls
+
+    assert asyncio.run(run()) == 1
+
+
+def test_worker_stops_when_idle():
+    async def run() -> None:
+        received: List[int] = []
+
+        async def callback(event: BatteryEvent) -> None:
+            received.append(event.value)
+
+        emitter = EventEmitter[BatteryEvent]()
+        listener = emitter.subscribe(callback)
+        emitter.notify(BatteryEvent(1))
+        await asyncio.sleep(0.01)
+        assert listener._worker is not None and listener._worker.done()
+
+        # a new worker is started for the next event
+        emitter.notify(BatteryEvent(2))
+        await asyncio.sleep(0.01)
+        assert received == [1, 2]
+        assert listener._worker.done()
+
+    asyncio.run(run())
+
+
+def test_unsubscribe_in_callback():
+    async def run() -> List[int]:
+        received: List[int] = []
+
+        async def callback(event: BatteryEvent) -> None:
+            listener.unsubscribe()
+            await asyncio.sleep(0)
+            received.append(event.value)
+
+        emitter = EventEmitter[BatteryEvent]()
+        listener = emitter.subscribe(callback)
+        emitter.notify(BatteryEvent(1))
+        emitter.notify(BatteryEvent(2))
+        await asyncio.sleep(0.01)
+        emitter.notify(BatteryEvent(3))
+        await asyncio.sleep(0.01)
+        return received
+
+    # queued events are still handled, but none after unsubscribing
+    assert asyncio.run(run()) == [1, 2]
+
+
+def test_close():
+    async def run() -> None:
+        async def callback(_: BatteryEvent) -> None:
+            pass
+
+        emitter = EventEmitter[BatteryEvent]()
+        emitter.subscribe(callback)
+        emitter.close()
+        assert not emitter.has_subscribers
+        assert not emitter.notify(BatteryEvent(1))
+
+    asyncio.run(run())
+
+
+def test_full_queue_drops_oldest_events():
+    async def run() -> List[int]:
+        received: List[int] = []
+
+        async def callback(event: BatteryEvent) -> None:
+            received.append(event.value)
+
+        emitter = EventEmitter[BatteryEvent]()
+        emitter.subscribe(callback)
+        # no await in between, therefore the callback cannot keep up
+        for value in range(_MAX_QUEUED_EVENTS + 50):
+            emitter.notify(BatteryEvent(value))
+        await asyncio.sleep(0.01)
+        return received
+
+    assert asyncio.run(run()) == list(range(50, _MAX_QUEUED_EVENTS + 50))
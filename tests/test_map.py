@@ -0,0 +1,52 @@
+import asyncio
+import base64
+import lzma
+import struct
+from typing import Dict, List
+
+from deebotozmo.commands import Command, GetMinorMap
+from deebotozmo.map import Map, MapPiece, _decompress_7z_base64_data
+
+
+def test_decompress_7z_base64_data():
+    expected = bytes(range(256)) * 40
+    compressed = lzma.compress(expected, format=lzma.FORMAT_ALONE)
+    # Ecovacs sends the header with a 4 byte uncompressed size field
+    compressed = compressed[:5] + struct.pack("<I", len(expected)) + compressed[13:]
+
+    data = base64.b64encode(compressed).decode()
+    assert _decompress_7z_base64_data(data) == expected
+
+
+def test_handle_major_map():
+    async def run() -> None:
+        commands: List[Command] = []
+
+        async def execute_command(command: Command) -> None:
+            commands.append(command)
+
+        map_ = Map(execute_command)
+
+        async def handle(crcs: Dict[int, int]) -> List[int]:
+            value = ",".join(str(crcs.get(i, MapPiece.NOT_INUSE)) for i in range(64))
+            commands.clear()
+            await map_._handle_major_map({"mid": "1", "value": value}, True)
+            assert all(isinstance(command, GetMinorMap) for command in commands)
+            return [command.args["pieceIndex"] for command in commands]
+
+        # changed pieces are requested
+        assert await handle({0: 123, 5: 456}) == [0, 5]
+        assert map_._map_pieces[0].in_use
+        assert map_._map_pieces[5].in_use
+
+        # unchanged pieces are not requested again
+        assert await handle({0: 123, 5: 456}) == []
+
+        assert await handle({0: 123, 5: 789}) == [5]
+
+        # pieces no longer in use are not requested
+        assert await handle({0: 123}) == []
+        assert map_._map_pieces[0].in_use
+        assert not map_._map_pieces[5].in_use
+
+    asyncio.run(run())
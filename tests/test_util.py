@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from deebotozmo.util import ConcurrencyLimiter
+
+
+def test_ConcurrencyLimiter():
+    async def run() -> int:
+        limiter = ConcurrencyLimiter(1)
+        running = 0
+        max_running = 0
+
+        async def work() -> None:
+            nonlocal running, max_running
+            async with limiter:
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        tasks = [asyncio.create_task(work()) for _ in range(4)]
+        await asyncio.sleep(0)
+        await limiter.set_limit(2)
+        await asyncio.gather(*tasks)
+        assert limiter.limit == 2
+        return max_running
+
+    assert asyncio.run(run()) == 2
+
+
+def test_ConcurrencyLimiter_cancelled_waiter():
+    async def run() -> bool:
+        limiter = ConcurrencyLimiter(1)
+
+        async def work() -> None:
+            async with limiter:
+                pass
+
+        await limiter.__aenter__()
+        cancelled = asyncio.create_task(work())
+        waiting = asyncio.create_task(work())
+        await asyncio.sleep(0)
+
+        # the released slot wakes up the first waiter, which is cancelled before it runs
+        await limiter.__aexit__(None, None, None)
+        cancelled.cancel()
+
+        await asyncio.wait_for(waiting, 1)
+        return cancelled.cancelled()
+
+    assert asyncio.run(run())
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_ConcurrencyLimiter_invalid_limit(limit: int):
+    with pytest.raises(ValueError):
+        ConcurrencyLimiter(limit)
+
+    async def run() -> None:
+        limiter = ConcurrencyLimiter(1)
+        with pytest.raises(ValueError):
+            await limiter.set_limit(limit)
+        assert limiter.limit == 1
+
+    asyncio.run(run())
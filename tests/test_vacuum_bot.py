@@ -0,0 +1,139 @@
+import asyncio
+import re
+from contextlib import ExitStack
+from typing import Any, Dict, Optional, Tuple, Union
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from deebotozmo.commands import COMMANDS, MAP_COMMANDS, Clean, CleanArea
+from deebotozmo.commands.clean import CleanAction, CleanMode
+from deebotozmo.events import StatusEvent
+from deebotozmo.models import RequestAuth, Vacuum, VacuumState
+from deebotozmo.vacuum_bot import VacuumBot
+
+
+def _create_bot(**kwargs: Any) -> VacuumBot:
+    vacuum = Vacuum(
+        {"did": "did", "class": "class", "resource": "resource", "status": 1}
+    )
+    return VacuumBot(
+        Mock(),
+        RequestAuth("user_id", "realm", "token", "resource"),
+        vacuum,
+        continent="eu",
+        country="de",
+        **kwargs,
+    )
+
+
+def _sent_args(command: Clean, state: VacuumState) -> Union[Dict[str, Any], list]:
+    async def run() -> Union[Dict[str, Any], list]:
+        bot = _create_bot()
+        bot.json = Mock()
+        bot.json.send_command = AsyncMock(
+            return_value={"ret": "ok", "resp": {"body": {"code": 0}}}
+        )
+        bot._status = StatusEvent(True, state)
+
+        await bot.execute_command(command)
+        bot.close()
+        return bot.json.send_command.call_args[0][0].args
+
+    return asyncio.run(run())
+
+
+def test_execute_command_clean_resume_not_paused():
+    assert _sent_args(Clean(CleanAction.RESUME), VacuumState.DOCKED) == {
+        "act": "start",
+        "type": "auto",
+    }
+
+
+def test_execute_command_clean_start_paused():
+    assert _sent_args(Clean(CleanAction.START), VacuumState.PAUSED) == {"act": "resume"}
+
+
+def test_execute_command_clean_area_unchanged():
+    command = CleanArea(CleanMode.SPOT_AREA, "1,2")
+    expected = dict(command.args)
+    assert _sent_args(command, VacuumState.PAUSED) == expected
+
+
+_MAP_COMMAND_NAMES = {command.name for command in MAP_COMMANDS}
+
+
+def _expected_handling(command_name: str) -> Tuple[str, Optional[Any]]:
+    """Return how the name was resolved with the former regex based normalization.
+
+    Map commands are matched against their names (not by "Map" in the name).
+    """
+    command_name = re.sub("^((on)|(off)|(report))", "get", command_name)
+    if command_name.endswith("_V2"):
+        command_name = command_name[:-3]
+
+    command = COMMANDS.get(command_name)
+    if command:
+        return "command", command
+    if command_name in _MAP_COMMAND_NAMES:
+        return "map", command_name
+    return "unknown", None
+
+
+def _command_name_variants():
+    names = list(COMMANDS) + list(_MAP_COMMAND_NAMES)
+    names += [
+        f"{prefix}{name[3:]}"
+        for name in names
+        if name.startswith("get")
+        for prefix in ("on", "off", "report")
+    ]
+    names += [
+        "onUnknown",
+        "getUnknown",
+        "reportStats",
+        "setUnknown",
+        "unknown",
+        "onMapState",
+    ]
+    return names + [f"{name}_V2" for name in names]
+
+
+@pytest.mark.parametrize("command_name", _command_name_variants())
+def test_handle_command_name(command_name: str):
+    async def run() -> Tuple[str, Optional[Any]]:
+        bot = _create_bot()
+        bot.map = Mock()
+        bot.map.handle = AsyncMock()
+        with ExitStack() as stack:
+            handles = {
+                command: stack.enter_context(patch.object(command, "handle"))
+                for command in set(COMMANDS.values())
+            }
+            await bot.handle(command_name, {"body": {}})
+
+        bot.close()
+        called = [command for command, handle in handles.items() if handle.called]
+        assert len(called) <= 1
+        if called:
+            assert not bot.map.handle.called
+            return "command", called[0]
+        if bot.map.handle.called:
+            name, _, requested = bot.map.handle.call_args[0]
+            assert requested is False
+            return "map", name
+        return "unknown", None
+
+    assert asyncio.run(run()) == _expected_handling(command_name)
+
+
+def test_max_concurrent_requests_invalid():
+    async def run() -> None:
+        with pytest.raises(ValueError):
+            _create_bot(max_concurrent_requests=0)
+
+        bot = _create_bot()
+        with pytest.raises(ValueError):
+            await bot.set_max_concurrent_requests(0)
+
+    asyncio.run(run())